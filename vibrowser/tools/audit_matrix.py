@@ -5,17 +5,50 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
 import re
-from dataclasses import asdict, dataclass
+import string
+import sys
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Pattern
+
+
+@lru_cache(maxsize=None)
+def audit_line_re() -> Pattern[str]:
+    # Headers and checkbox rows share one pattern so each line is matched once;
+    # the named groups tell the two line kinds apart.
+    return re.compile(
+        r"^\s*(?:"
+        r"(?P<level>#{2,3})\s+(?P<title>\S.*?)"
+        r"|- \[(?P<check>[ xX])\] (?P<body>\s*\S.*?)"
+        r")\s*$"
+    )
+
+
+@lru_cache(maxsize=None)
+def slug_re() -> Pattern[str]:
+    return re.compile(r"[^a-z0-9]+")
+
 
+# slugify maps every ASCII character outside [a-z0-9] to "-" with one
+# translate call; non-ASCII text falls back to slug_re().
+SLUG_TABLE = {code: "-" for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits}
 
-CHECKBOX_RE = re.compile(r"^- \[(?P<check>[ xX])\] (?P<body>.+?)\s*$")
-HEADER_RE = re.compile(r"^(?P<level>#{2,3})\s+(?P<title>.+?)\s*$")
+# Canonical declared-status strings; every AuditItem.declared_status and every
+# summary counter key refers to one of these objects.
+DECLARED_STATUSES: Dict[str, str] = {
+    status: sys.intern(status) for status in ("implemented", "partial", "missing", "unspecified")
+}
 
+# Slotted dataclasses need Python 3.10+; older interpreters get plain ones.
+DATACLASS_OPTIONS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class AuditItem:
     item_id: str
     section: str
@@ -27,17 +60,46 @@ class AuditItem:
     source_line: int
     stale_evidence: List[str]
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "item_id": self.item_id,
+            "section": self.section,
+            "subsection": self.subsection,
+            "feature": self.feature,
+            "checked": self.checked,
+            "declared_status": self.declared_status,
+            "note": self.note,
+            "source_line": self.source_line,
+            "stale_evidence": list(self.stale_evidence),
+        }
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Probe:
     probe_id: str
     description: str
-    feature_regex: str
     file_path: str
     required_snippets: List[str]
     required_if_claim_present: bool = True
-
-
+    # Exactly one of these selects the claims a probe checks: a regex searched
+    # in the feature, or an exact (case-insensitive) feature name.
+    feature_regex: Optional[str] = None
+    feature_literal: Optional[str] = None
+    # UTF-8 encoded required_snippets, searched directly in the mapped source file.
+    required_snippet_bytes: List[bytes] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if (self.feature_regex is None) == (self.feature_literal is None):
+            raise ValueError(f"Probe {self.probe_id} needs exactly one of feature_regex or feature_literal")
+        # Longer snippets are rarer, so checking them first fails fastest.
+        self.required_snippets = sorted(self.required_snippets, key=len, reverse=True)
+        self.required_snippet_bytes = [snippet.encode("utf-8") for snippet in self.required_snippets]
+
+
+# Each claim is attributed to at most one probe: an exact feature_literal match
+# wins, otherwise the first probe in this list whose feature_regex matches.
+# Keep probe feature patterns disjoint; a probe that overlaps an earlier one
+# (or a literal probe) never receives the overlapping claims.
 PROBES: List[Probe] = [
     Probe(
         probe_id="events-keyboard-dispatch",
@@ -49,16 +111,16 @@ PROBES: List[Probe] = [
     Probe(
         probe_id="events-dblclick-dispatch",
         description="dblclick dispatch exists",
-        feature_regex=r"^dblclick$",
         file_path="src/shell/browser_window.mm",
         required_snippets=['"dblclick"', "didDoubleClickAtX"],
+        feature_literal="dblclick",
     ),
     Probe(
         probe_id="events-contextmenu-dispatch",
         description="contextmenu dispatch exists",
-        feature_regex=r"^contextmenu$",
         file_path="src/shell/browser_window.mm",
         required_snippets=['"contextmenu"', "didContextMenuAtX"],
+        feature_literal="contextmenu",
     ),
     Probe(
         probe_id="events-form-dispatch",
@@ -69,19 +131,40 @@ PROBES: List[Probe] = [
     ),
 ]
 
+# Literal probes are resolved with a dict lookup on the lowercased feature.
+# The remaining feature regexes are joined into one alternation; the matching
+# named group identifies the probe, so each item's feature is searched once.
+PROBES_BY_LITERAL: Dict[str, Probe] = {
+    probe.feature_literal.lower(): probe for probe in PROBES if probe.feature_literal is not None
+}
+PROBES_BY_GROUP: Dict[str, Probe] = {
+    "probe_" + probe.probe_id.replace("-", "_"): probe for probe in PROBES if probe.feature_regex is not None
+}
+
+
+@lru_cache(maxsize=None)
+def probe_feature_re() -> Pattern[str]:
+    # With no regex probes an empty alternation would match every feature;
+    # fall back to a pattern that never matches.
+    return re.compile(
+        "|".join(f"(?P<{group}>{probe.feature_regex})" for group, probe in PROBES_BY_GROUP.items()) or "(?!)",
+        re.IGNORECASE,
+    )
+
 
 def slugify(text: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    lowered = text.lower()
+    if lowered.isascii():
+        slug = "-".join(filter(None, lowered.translate(SLUG_TABLE).split("-")))
+    else:
+        slug = slug_re().sub("-", lowered).strip("-")
     return slug or "item"
 
 
 def normalize_declared_status(checked: bool, raw_status: str) -> str:
     if checked:
-        return "implemented"
-    status = raw_status.strip().lower()
-    if status in {"implemented", "partial", "missing"}:
-        return status
-    return "unspecified"
+        return DECLARED_STATUSES["implemented"]
+    return DECLARED_STATUSES.get(raw_status.strip().lower(), DECLARED_STATUSES["unspecified"])
 
 
 def parse_audit(audit_path: Path) -> List[AuditItem]:
@@ -89,102 +172,144 @@ def parse_audit(audit_path: Path) -> List[AuditItem]:
     subsection = ""
     items: List[AuditItem] = []
 
-    for line_number, raw_line in enumerate(audit_path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = raw_line.strip()
-        header_match = HEADER_RE.match(line)
-        if header_match:
-            level = header_match.group("level")
-            title = header_match.group("title")
-            if level == "##":
-                section = title
-                subsection = ""
-            elif level == "###":
-                subsection = title
-            continue
-
-        checkbox_match = CHECKBOX_RE.match(line)
-        if not checkbox_match:
-            continue
-
-        body = checkbox_match.group("body")
-        checked = checkbox_match.group("check").lower() == "x"
-
-        parts = [part.strip() for part in body.split(" — ")]
-        feature = parts[0]
-        raw_status = parts[1] if len(parts) >= 2 else ""
-        note = " — ".join(parts[2:]).strip() if len(parts) >= 3 else ""
-
-        item_id = slugify(f"{section}-{subsection}-{feature}")
-        items.append(
-            AuditItem(
-                item_id=item_id,
-                section=section,
-                subsection=subsection,
-                feature=feature,
-                checked=checked,
-                declared_status=normalize_declared_status(checked, raw_status),
-                note=note,
-                source_line=line_number,
-                stale_evidence=[],
+    line_re = audit_line_re()
+    with audit_path.open("r", encoding="utf-8", buffering=1 << 16) as audit_file:
+        # File iteration only breaks on \n, \r and \r\n; splitting each chunk
+        # again keeps the str.splitlines() boundaries (\x0c, \x85, \u2028, ...)
+        # so source_line numbers match a whole-file splitlines() scan.
+        lines = (line for chunk in audit_file for line in chunk.splitlines())
+        for line_number, line in enumerate(lines, start=1):
+            # Most lines are prose; reject them on their first characters
+            # without entering the regex engine.
+            if not line.lstrip().startswith(("#", "- [")):
+                continue
+            match = line_re.match(line)
+            if not match:
+                continue
+
+            level = match.group("level")
+            if level:
+                # Interned so every item under a header shares one string object.
+                title = sys.intern(match.group("title"))
+                if level == "##":
+                    section = title
+                    subsection = ""
+                elif level == "###":
+                    subsection = title
+                continue
+
+            body = match.group("body")
+            checked = match.group("check").lower() == "x"
+
+            feature, _, rest = body.partition(" — ")
+            feature = feature.strip()
+            raw_status, _, note = rest.partition(" — ")
+            note = note.strip()
+
+            item_id = slugify(f"{section}-{subsection}-{feature}")
+            items.append(
+                AuditItem(
+                    item_id=item_id,
+                    section=section,
+                    subsection=subsection,
+                    feature=feature,
+                    checked=checked,
+                    declared_status=normalize_declared_status(checked, raw_status),
+                    note=note,
+                    source_line=line_number,
+                    stale_evidence=[],
+                )
             )
-        )
 
     return items
 
 
+def map_source_file(file_path: Path, stack: ExitStack) -> Optional[mmap.mmap]:
+    # Empty files cannot be mapped and, like missing ones, hold no evidence.
+    try:
+        source = file_path.open("rb")
+    except FileNotFoundError:
+        return None
+    with source:
+        if os.fstat(source.fileno()).st_size == 0:
+            return None
+        mapped = stack.enter_context(mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ))
+    # Start kernel readahead now so the snippet scans do not fault page by page.
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mapped.madvise(mmap.MADV_WILLNEED)
+    return mapped
+
+
 def apply_probes(items: List[AuditItem], repo_root: Path) -> Dict[str, Dict[str, object]]:
     probe_results: Dict[str, Dict[str, object]] = {}
-    file_cache: Dict[Path, str] = {}
-
-    for probe in PROBES:
-        regex = re.compile(probe.feature_regex, re.IGNORECASE)
-        matching_items = [
-            item
-            for item in items
-            if regex.search(item.feature)
-            and item.declared_status in {"partial", "missing", "unspecified"}
-        ]
-
-        file_path = repo_root / probe.file_path
-        if file_path not in file_cache:
-            file_cache[file_path] = file_path.read_text(encoding="utf-8") if file_path.exists() else ""
-        content = file_cache[file_path]
-
-        found = bool(content) and all(snippet in content for snippet in probe.required_snippets)
-        if found:
-            for item in matching_items:
-                item.stale_evidence.append(probe.probe_id)
-
-        probe_results[probe.probe_id] = {
-            "description": probe.description,
-            "matched_claim_count": len(matching_items),
-            "evidence_found": found,
-            "required_if_claim_present": probe.required_if_claim_present,
-        }
+
+    feature_re = probe_feature_re()
+    claims_by_probe: Dict[str, List[AuditItem]] = {probe.probe_id: [] for probe in PROBES}
+    for item in items:
+        # Only non-implemented claims can be stale; skip the rest before matching.
+        if item.declared_status not in {"partial", "missing", "unspecified"}:
+            continue
+        probe = PROBES_BY_LITERAL.get(item.feature.lower())
+        if probe is None:
+            match = feature_re.search(item.feature)
+            if not match:
+                continue
+            probe = PROBES_BY_GROUP[match.lastgroup]
+        claims_by_probe[probe.probe_id].append(item)
+
+    file_cache: Dict[Path, Optional[mmap.mmap]] = {}
+    with ExitStack() as stack:
+        for probe in PROBES:
+            matching_items = claims_by_probe[probe.probe_id]
+
+            # Without claims to flag there is nothing to verify, so skip the file.
+            found = False
+            if matching_items:
+                file_path = repo_root / probe.file_path
+                if file_path not in file_cache:
+                    file_cache[file_path] = map_source_file(file_path, stack)
+                content = file_cache[file_path]
+
+                # mmap has no substring __contains__, so search with find().
+                found = content is not None and all(
+                    content.find(snippet) != -1 for snippet in probe.required_snippet_bytes
+                )
+                if found:
+                    for item in matching_items:
+                        item.stale_evidence.append(probe.probe_id)
+
+            probe_results[probe.probe_id] = {
+                "description": probe.description,
+                "matched_claim_count": len(matching_items),
+                "evidence_found": found,
+                "required_if_claim_present": probe.required_if_claim_present,
+            }
 
     return probe_results
 
 
 def summarize(items: List[AuditItem]) -> Dict[str, object]:
-    summary: Dict[str, object] = {
-        "total_items": len(items),
-        "by_status": {"implemented": 0, "partial": 0, "missing": 0, "unspecified": 0},
-        "by_section": {},
-        "stale_evidence_items": 0,
-    }
-
+    by_status: Dict[str, int] = dict.fromkeys(DECLARED_STATUSES, 0)
     by_section: Dict[str, Dict[str, int]] = {}
+    stale_evidence_items = 0
+
     for item in items:
-        summary["by_status"][item.declared_status] += 1  # type: ignore[index]
+        status = item.declared_status
+        by_status[status] += 1
         sec = item.section or "(unsectioned)"
-        if sec not in by_section:
-            by_section[sec] = {"implemented": 0, "partial": 0, "missing": 0, "unspecified": 0}
-        by_section[sec][item.declared_status] += 1
+        sec_counts = by_section.get(sec)
+        if sec_counts is None:
+            sec_counts = by_section[sec] = dict.fromkeys(DECLARED_STATUSES, 0)
+        sec_counts[status] += 1
         if item.stale_evidence:
-            summary["stale_evidence_items"] += 1
+            stale_evidence_items += 1
 
-    summary["by_section"] = by_section
-    return summary
+    return {
+        "total_items": len(items),
+        "by_status": by_status,
+        "by_section": by_section,
+        "stale_evidence_items": stale_evidence_items,
+    }
 
 
 def write_markdown(items: List[AuditItem], summary: Dict[str, object], probe_results: Dict[str, Dict[str, object]], md_out: Path) -> None:
@@ -228,7 +353,8 @@ def write_markdown(items: List[AuditItem], summary: Dict[str, object], probe_res
                 f"({item.section} / {item.subsection}) -> evidence: {', '.join(item.stale_evidence)}"
             )
 
-    md_out.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with md_out.open("w", encoding="utf-8", buffering=1 << 16) as md_file:
+        md_file.writelines(line + "\n" for line in lines)
 
 
 def verify(summary: Dict[str, object], probe_results: Dict[str, Dict[str, object]]) -> int:
@@ -239,16 +365,15 @@ def verify(summary: Dict[str, object], probe_results: Dict[str, Dict[str, object
         errors.append(f"Expected >=600 audit items, got {total_items}")
 
     by_section = summary["by_section"]
-    for required in ("CSS Properties", "JS Events API", "Networking & Protocols"):
-        if required not in by_section:
-            errors.append(f"Missing required section in parsed output: {required}")
+    errors.extend(
+        f"Missing required section in parsed output: {required}"
+        for required in ("CSS Properties", "JS Events API", "Networking & Protocols")
+        if required not in by_section
+    )
 
     for probe_id, result in probe_results.items():
-        claims = int(result["matched_claim_count"])
-        evidence_found = bool(result["evidence_found"])
-        required = bool(result["required_if_claim_present"])
-        if required and claims > 0 and not evidence_found:
-            errors.append(f"Probe {probe_id} matched {claims} claim(s) but found no evidence")
+        if result["required_if_claim_present"] and result["matched_claim_count"] and not result["evidence_found"]:
+            errors.append(f"Probe {probe_id} matched {result['matched_claim_count']} claim(s) but found no evidence")
 
     if errors:
         for err in errors:
@@ -277,9 +402,11 @@ def main() -> int:
         "audit_file": str(args.audit),
         "summary": summary,
         "probe_results": probe_results,
-        "items": [asdict(item) for item in items],
+        "items": [item.to_dict() for item in items],
     }
-    args.json_out.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    with args.json_out.open("w", encoding="utf-8", buffering=1 << 16) as json_file:
+        json.dump(payload, json_file, indent=2, ensure_ascii=True)
+        json_file.write("\n")
     write_markdown(items, summary, probe_results, args.md_out)
 
     if args.verify: